@@ -8,42 +8,99 @@ won't have to deal with the demands on my memory and year_and_month that preproc
 that data would have required (not to speak of the training and testing of
 models).
 """
-import re
+import io
 import os
+import zlib
+import types
+import shutil
+import asyncio
+import aiohttp
+import aiofiles
 import requests
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+import zipfile as zipfile_module
 
 from pathlib import Path
-from typing import final
+from typing import IO, Any, TypeVar, Coroutine, final
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from urllib3.util import Retry
+from requests.adapters import HTTPAdapter
 from loguru import logger
 from zipfile import ZipFile
 from datetime import datetime as dt
 from argparse import ArgumentParser
+from email.utils import formatdate
 
-from src.setup.paths import RAW_DATA_DIR, make_needed_directories
+from src.setup.paths import RAW_DATA_DIR, PARQUETS, make_needed_directories
 from src.setup.config import proper_city_name
 
+try:
+    import uvloop  # Not available on Windows
+except ImportError:
+    uvloop = None
+
+try:
+    from isal import isal_zlib
+except ImportError:
+    isal_zlib = None
+
+
+T = TypeVar("T")
+
+MAX_CONCURRENT_DOWNLOADS = 8
+
+SERVICE_NAMES = {
+    "bay_area": "bay-wheels",
+    "chicago": "divvybikes",
+    "new_york": "citibikenyc",
+    "columbus": "cogobikeshare",
+    "washington_dc": "capitalbikeshare",
+    "portland": "biketownpdx"
+}
+
+# The names of the monthly data files, which are formatted with the year and month (e.g. 202401)
+FILE_NAME_TEMPLATES = {
+    "chicago": "{year_and_month}-divvy-tripdata",
+    "new_york": "{year_and_month}-citibike-tripdata",
+    "columbus": "{year_and_month}-cogo-tripdata",
+    "washington_dc": "{year_and_month}-capitalbikeshare-tripdata",
+    "portland": "{year_and_month}.csv"
+}
+
+URL_HEADS = {
+    "chicago": "https://divvy-tripdata.s3.amazonaws.com/",
+    "new_york": "https://s3.amazonaws.com/tripdata/",
+    "columbus": "https://cogo-sys-data.s3.amazonaws.com/",
+    "washington_dc": "https://s3.amazonaws.com/capitalbikeshare-data/",
+    "portland": "https://s3.amazonaws.com/biketown-tripdata-public/"
+}
+
 
 @final
 class DataDownloader:
+
+    # Shared by all instances so that connections (and their TLS handshakes) are reused across requests
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=8, max_retries=Retry(total=3, backoff_factor=0.3)))
+
     def __init__(self, city_name: str, year: int):  
         
         self.year = year
         self.city_name: str = city_name.lower()
         self.proper_city_name = proper_city_name(city_name)
 
-        self.service_names = {
-            "bay_area": "bay-wheels",
-            "chicago": "divvybikes",
-            "new_york": "citibikenyc",
-            "columbus": "cogobikeshare",
-            "washington_dc": "capitalbikeshare",
-            "portland": "biketownpdx"
-        }
-  
-        assert self.city_name in self.service_names.keys(), "Lyft doesn't have a bike-sharing system in the named city"
+        assert self.city_name in SERVICE_NAMES.keys(), "Lyft doesn't have a bike-sharing system in the named city"
 
-    def load_raw_data(self, just_download: bool, months: list[int] | None = None) -> pd.DataFrame | None:
+    def load_raw_data(
+        self, 
+        just_download: bool, 
+        months: list[int] | None = None, 
+        keep_zipfiles: bool = False
+    ) -> pd.DataFrame | None:
         """
         Download or load the data for either the specified months of the year in question, 
         or for all months up to the present month (if the data being sought is from this year).
@@ -51,33 +108,109 @@ class DataDownloader:
         Args:
             year (int): the year whose data we want to load
             months (list[int] | None, optional): the months for which we want data
+            keep_zipfiles (bool, optional): whether to keep the downloaded zipfiles, so that they are 
+                                            only downloaded again if they change. Defaults to False.
         """
         make_needed_directories()
         is_current_year = True if self.year == dt.now().year else False
         end_month = dt.now().month if is_current_year else 12
         months_to_query_for = range(1, end_month + 1) if months is None else months
  
-        data = pd.DataFrame()
         logger.info(f"Searching local directories for data from {self.proper_city_name}'s.")
         
         if self.city_has_data():
+            months_to_download = []
             for month in months_to_query_for:
                 file_name = self.get_data_file_name(month=month)
-                    
-                if just_download:
-                    if self.data_file_exists(file_name=file_name):     
-                        logger.success(f"{file_name} is already saved to disk")
-                    else:
-                        data_for_the_month: pd.DataFrame = self.download_one_file_of_raw_data(month=month, keep_zipfile=False)
+
+                # .csv files extracted before the data was kept as parquet files
+                if not self.data_file_exists(file_name=file_name) and self.get_csv_path(file_name=file_name).exists():
+                    self.convert_to_parquet(file_name=file_name)
+
+                if self.data_file_exists(file_name=file_name):
+                    logger.success(f"{file_name} is already saved to disk")
                 else:
-                    if self.data_file_exists(file_name=file_name):
-                        logger.success(f"{file_name} is already saved to disk")
-                        data_for_the_month: pd.DataFrame = pd.read_csv(RAW_DATA_DIR/f"{file_name}/{file_name}.csv")  
-                    else:
-                        data_for_the_month = self.download_one_file_of_raw_data(month=month, keep_zipfile=False)
-            
-                data = pd.concat([data, data_for_the_month], axis=0)
-            return data
+                    months_to_download.append(month)
+
+            if months_to_download:
+                self.download_raw_data(months=months_to_download, keep_zipfiles=keep_zipfiles)
+
+            if just_download:
+                return None
+
+            # Concatenating once at the end avoids copying the accumulated data every month
+            monthly_data: list[pd.DataFrame] = []
+            for month in months_to_query_for:
+                file_name = self.get_data_file_name(month=month)
+
+                if self.data_file_exists(file_name=file_name):
+                    monthly_data.append(self.load_data_for_the_month(file_name=file_name))
+
+            return pd.concat(monthly_data, axis=0, copy=False, ignore_index=True) if monthly_data else pd.DataFrame()
+
+    def download_raw_data(self, months: list[int], keep_zipfiles: bool = False) -> None:
+        """
+        Download the zipfiles for the given months concurrently, rather than one after 
+        the other, and extract the .csv file inside each of them. 
+
+        Args:
+            months (list[int]): the months whose data we want to download
+            keep_zipfiles (bool, optional): whether to keep the zipfiles. Defaults to False.
+        """
+        urls = {month: self.get_url_for_city_data(month=month) for month in months}
+        zipfile_paths = {
+            month: RAW_DATA_DIR/self.city_name/self.get_zipfile_name(url=url) for month, url in urls.items() if url is not None
+        }
+
+        run_coroutine(
+            self._download_concurrently(
+                urls_and_paths=[(urls[month], path) for month, path in zipfile_paths.items()], 
+                keep_zipfiles=keep_zipfiles
+            )
+        )
+
+    async def _download_concurrently(self, urls_and_paths: list[tuple[str, Path]], keep_zipfiles: bool) -> None:
+        """
+        Each zipfile is handed to a worker thread for extraction and parsing as soon as its 
+        download finishes, so that this work overlaps with the downloads still in progress.
+        """
+        connector = aiohttp.TCPConnector(limit=MAX_CONCURRENT_DOWNLOADS)
+
+        # No cap on the total duration, as large zipfiles sharing one connection can take well over aiohttp's default 
+        # of 5 minutes. Stalled connections are still caught by the limits on connecting and on each read.
+        timeout = aiohttp.ClientTimeout(total=None, sock_connect=30, sock_read=60)
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+                _ = await asyncio.gather(
+                    *[
+                        self._download_and_extract(
+                            session=session, 
+                            executor=executor, 
+                            url=url, 
+                            path=path, 
+                            keep_zipfile=keep_zipfiles
+                        ) 
+                        for url, path in urls_and_paths
+                    ]
+                )
+
+    async def _download_and_extract(
+        self, 
+        session: aiohttp.ClientSession, 
+        executor: ThreadPoolExecutor, 
+        url: str, 
+        path: Path, 
+        keep_zipfile: bool
+    ) -> None:
+
+        loop = asyncio.get_running_loop()
+
+        if await _fetch(session=session, url=url, zipfile_path=path):
+            try:
+                await loop.run_in_executor(executor, self.extract_zipfile, path, keep_zipfile)
+            except Exception as error:
+                logger.error(error)
 
     def city_has_data(self) -> bool:
         """
@@ -86,118 +219,169 @@ class DataDownloader:
         Returns:
             bool: True if the data exists, and false if it doesn't
         """
-        if self.city_name in self.service_names.keys():
-            service_name = self.service_names[self.city_name]
-
-            # The page with the Bay Area data has a different URL format
-            if self.city_name == "bay_area":
-                system_data_url = f"https://lyft.com/bikes/{service_name}"
-            else:
-                system_data_url = f"https://{service_name}.com/system-data"
-            
-            logger.info(f"Checking whether Lyft has published any data from {self.proper_city_name}")
-            response = requests.get(url=system_data_url)
-            
-            if response.status_code == 200:
-                logger.success(f"There's data from {self.proper_city_name}!")
-                return True
-            else:
-                logger.error(f"Lyft hasn't published any data for {self.proper_city_name}")
-                return False
+        service_name = SERVICE_NAMES[self.city_name]
 
+        # The page with the Bay Area data has a different URL format
+        if self.city_name == "bay_area":
+            system_data_url = f"https://lyft.com/bikes/{service_name}"
         else:
-            logger.error(f"Lyft isn't currently operating a bike-sharing service in this city") 
+            system_data_url = f"https://{service_name}.com/system-data"
+        
+        logger.info(f"Checking whether Lyft has published any data from {self.proper_city_name}")
+        try:
+            data_is_published = self.page_is_available(url=system_data_url)
+        except requests.RequestException as error:
+            logger.error(f"Couldn't reach {system_data_url}: {error}")
             return False
 
-    def get_data_file_name(self, month: int) -> str:
-        
-        year_and_month = f"{self.year}{month:02d}"
-
-        city_name_and_url = {
-            "chicago": f"{year_and_month}-divvy-tripdata",
-            "new_york": f"{year_and_month}-citibike-tripdata",
-            "columbus": f"{year_and_month}-cogo-tripdata",
-            "washington_dc": f"{year_and_month}-capitalbikeshare-tripdata",
-            "portland": f"{year_and_month}.csv"
-        }
+        if data_is_published:
+            logger.success(f"There's data from {self.proper_city_name}!")
+            return True
+        else:
+            logger.error(f"Lyft hasn't published any data for {self.proper_city_name}")
+            return False
 
-        return city_name_and_url[self.city_name]
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def page_is_available(url: str) -> bool:
+        """
+        Send a HEAD request to the given page, so that only its headers are downloaded. If the 
+        server doesn't accept HEAD requests, fall back to a GET request whose body is never read.
+        The result is cached, as the answer won't change over the course of a run.
 
-    def get_url_for_city_data(self, month: int) -> str | None:
+        Args:
+            url (str): the page in question
 
-        city_name_and_url_head: dict[str, str] = {
-            "chicago": f"divvy-tripdata.s3.amazonaws.com/",
-            "new_york": f"s3.amazonaws.com/tripdata/",
-            "columbus": f"cogo-sys-data.s3.amazonaws.com/",
-            "washington_dc": f"s3.amazonaws.com/capitalbikeshare-data/",
-            "portland": f"s3.amazonaws.com/biketown-tripdata-public/"
-        }
+        Returns:
+            bool: whether the page responded with a status code of 200 
+        """
+        response = DataDownloader.session.head(url, allow_redirects=True, timeout=5)
+
+        if response.status_code in (403, 405):
+            with DataDownloader.session.get(url, stream=True, timeout=5) as response:
+                return response.status_code == 200
+
+        return response.status_code == 200
+
+    def get_data_file_name(self, month: int) -> str:
+        return FILE_NAME_TEMPLATES[self.city_name].format(year_and_month=f"{self.year}{month:02d}")
+
+    def get_url_for_city_data(self, month: int) -> str | None:
 
         if self.city_name == "portland" and self.year > 2020:
             logger.error("Lyft doesn't provide data on Portland after 2020.")
         else:
             file_name: str = self.get_data_file_name(month=month)
-            return "https://" + city_name_and_url_head[self.city_name] + file_name + ".zip"
+            return URL_HEADS[self.city_name] + file_name + ".zip"
    
-    def data_file_exists(self, file_name: str):
-       file_path = RAW_DATA_DIR/self.city_name/file_name
-       return True if file_path.exists() else False
+    def data_file_exists(self, file_name: str) -> bool:
+        return self.get_parquet_path(file_name=file_name).exists()
 
-    def download_one_file_of_raw_data(self, month: int, keep_zipfile: bool = False) -> pd.DataFrame | None:
+    def get_csv_path(self, file_name: str) -> Path:
+        return RAW_DATA_DIR/self.city_name/file_name/f"{file_name}.csv"
+
+    def get_parquet_path(self, file_name: str) -> Path:
+        return PARQUETS/self.city_name/f"{file_name}.parquet"
+
+    def convert_to_parquet(self, file_name: str) -> None:
+        """
+        Parse the extracted .csv file for a given month, and save its contents as a parquet 
+        file so that later runs needn't parse the .csv file again. The .csv file (and its 
+        folder) is then deleted, leaving the parquet file as the only copy of the data.
+
+        Args:
+            file_name (str): the name of the extracted data file
         """
-        Download the data for a given year, specifying the month if necessary,
-        and the file name for the downloaded file.
+        csv_path = self.get_csv_path(file_name=file_name)
+        parquet_path = self.get_parquet_path(file_name=file_name)
+        table = read_trip_table(csv_path=csv_path)
 
-        If the HTTP request for the data is successful, download the zipfile
-        containing the data, and extract the .csv file into a folder of the
-        same name. The zipfile will be deleted by default, unless otherwise
-        specified.
+        # Write to a temporary file first, so that an interrupted write never leaves a partial parquet file behind
+        partial_parquet_path = parquet_path.with_suffix(".parquet.partial")
+        pq.write_table(table, partial_parquet_path, compression="zstd", compression_level=3)
+        _ = partial_parquet_path.replace(parquet_path)
+
+        csv_path.unlink()
+        csv_path.parent.rmdir()
+
+    def load_data_for_the_month(self, file_name: str) -> pd.DataFrame:
+        """
+        Load a month's data from its parquet file.
 
         Args:
-            year (int): the year in question
-            keep_zipfile (bool, optional): whether to keep the zipfile. . 
-            month (int, optional): the month we want data for. Defaults to None.
+            file_name (str): the name of the extracted data file
+
+        Returns:
+            pd.DataFrame: the data for the month
         """
-        url: str = self.get_url_for_city_data(month=month) 
+        table = pq.read_table(self.get_parquet_path(file_name=file_name))
+        return table.to_pandas(self_destruct=True)
 
-        zipfile_name = self.get_zipfile_name(url=url)
+    def download_one_file_of_raw_data(self, month: int, keep_zipfile: bool = False) -> pd.DataFrame | None:
+        """
+        Download and load the data for a single month of the year in question. This goes 
+        through the same download and extraction path as load_raw_data.
+
+        Args:
+            month (int): the month we want data for
+            keep_zipfile (bool, optional): whether to keep the zipfile. Defaults to False.
+
+        Returns:
+            pd.DataFrame | None: the data for the month, or None if it couldn't be downloaded
+        """
+        file_name = self.get_data_file_name(month=month)
+        self.download_raw_data(months=[month], keep_zipfiles=keep_zipfile)
+
+        if self.data_file_exists(file_name=file_name):
+            return self.load_data_for_the_month(file_name=file_name)
+
+    def extract_zipfile(self, zipfile_path: Path, keep_zipfile: bool = False) -> None:
+        """
+        Extract the .csv file in the given zipfile into a folder of the same name, 
+        deleting the zipfile afterwards unless otherwise specified.
+
+        Args:
+            zipfile_path (Path): the path to the downloaded zipfile
+            keep_zipfile (bool, optional): whether to keep the zipfile. Defaults to False.
+        """
+        file_name = zipfile_path.name[:-4]  # Remove ".zip" from the name of the zipfile
+
+        # Read the zipfile through a single 32KB buffer rather than letting the decompressor make many small reads
+        with (
+            open(file=zipfile_path, mode="rb", buffering=0) as raw_file,
+            io.BufferedReader(raw_file, buffer_size=32768) as buffered_file
+        ):
+            self.extract_csv(source=buffered_file, file_name=file_name)
         
-        # Prepare paths for the download and extraction of the zipfile 
-        file_name = zipfile_name[:-4]  # Remove ".zip" from the name of the zipfile 
+        if not keep_zipfile:
+            os.remove(zipfile_path)
+
+    def extract_csv(self, source: IO[bytes], file_name: str) -> None:
+        """
+        Extract the .csv file from an open zipfile into a folder of the same name, 
+        and save its contents as a parquet file.
+
+        Args:
+            source (IO[bytes]): the open zipfile
+            file_name (str): the name of the zipfile, without the ".zip" extension
+        """
         data_directory = RAW_DATA_DIR /self.city_name/ file_name 
-        zipfile_path = RAW_DATA_DIR /self.city_name/ zipfile_name
 
-        # Make request for the zipfile  
-        try:
-            logger.info(f"Downloading {zipfile_name}")
-            response = requests.get(url) 
-            logger.success("Download successful!")
-            
-            if not Path(data_directory).exists():
-                os.mkdir(data_directory)
-
-            # Write the zipfile to the file system
-            with open(file=zipfile_path, mode="wb") as directory:
-                _ = directory.write(response.content)
-            
-            # Extract the zipfile
-            extracted_file_path = RAW_DATA_DIR /self.city_name/ file_name  
-            with ZipFile(file=zipfile_path, mode="r") as zipfile:
-                _ = zipfile.extract(f"{file_name}.csv", extracted_file_path)  # Extract csv file
-            
-            if not keep_zipfile:
-                os.remove(zipfile_path)
-     
-            data_for_the_month: pd.DataFrame = pd.read_csv(data_directory/f"{file_name}.csv")
-            return data_for_the_month
-
-        except Exception as error: 
-            logger.error(error)
+        with ZipFile(file=source, mode="r") as zipfile, zipfile.open(f"{file_name}.csv") as csv_file:
+            # Only make the directory once we know the zipfile contains the csv file, so that a failed
+            # extraction doesn't leave behind an empty directory.
+            data_directory.mkdir(parents=True, exist_ok=True)
+
+            # Copy the csv file out in 1MB chunks, rather than through extract()'s default 8KB buffer
+            with open(file=data_directory/f"{file_name}.csv", mode="wb", buffering=1 << 20) as destination:
+                shutil.copyfileobj(csv_file, destination, length=1 << 20)
+
+        self.convert_to_parquet(file_name=file_name)
 
     @staticmethod
     def get_zipfile_name(url: str) -> str:
         """
-        Use a regular expression to extract the name of the data file from its associated URL
+        Extract the name of the data file from its associated URL (everything after the last slash)
 
         Args:
             url (str): the link to the data file being downloaded
@@ -205,23 +389,224 @@ class DataDownloader:
         Returns:
             str: the name of the zipfile/raw data file to be downloaded
         """
-        pattern = r"([^/]+)$"  # Exclude all the characters before the last slash
-        match = re.search(pattern, url)
+        zipfile_name = url.rsplit("/", 1)[-1]
 
-        if match:
-            return match.group(1)
+        if zipfile_name:
+            return zipfile_name
         else:
             raise Exception("Invalid URL")
 
 
+# The known columns of Lyft's trip data. Giving these up front lets pyarrow skip type inference, stores the 
+# low-cardinality columns as categoricals rather than as Python strings, and parses the timestamps only once.
+# Blank cells in these columns (and in the station name columns, whose types are inferred) are loaded as 
+# missing values, as they were with pd.read_csv, because read_trip_table sets strings_can_be_null.
+TRIP_DATA_COLUMN_TYPES = {
+    "ride_id": pa.string(),
+    "rideable_type": pa.dictionary(pa.int32(), pa.string()),
+    "started_at": pa.timestamp("ms"),
+    "ended_at": pa.timestamp("ms"),
+    "start_station_id": pa.string(),
+    "end_station_id": pa.string(),
+    "start_lat": pa.float64(),
+    "start_lng": pa.float64(),
+    "end_lat": pa.float64(),
+    "end_lng": pa.float64(),
+    "member_casual": pa.dictionary(pa.int32(), pa.string())
+}
+
+
+def read_trip_table(csv_path: Path) -> pa.Table:
+    """
+    Parse a .csv file of trip data with pyarrow's multithreaded reader, using the known 
+    types of its columns. Columns that are absent from a given file are simply ignored.
+
+    Args:
+        csv_path (Path): the path to the .csv file
+
+    Returns:
+        pa.Table: the trip data
+    """
+    return pacsv.read_csv(
+        csv_path,
+        read_options=pacsv.ReadOptions(block_size=1 << 22),
+        convert_options=pacsv.ConvertOptions(
+            column_types=TRIP_DATA_COLUMN_TYPES, 
+            strings_can_be_null=True  # So that blank cells (e.g. missing station IDs) are nulls, rather than ""
+        )
+    )
+
+
+def run_coroutine(coroutine: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion on a new event loop (a uvloop one, where uvloop is available), 
+    without changing the process-wide event loop policy.
+
+    If an event loop is already running in this thread (as in a Jupyter notebook), the coroutine 
+    is run on a separate thread instead, as a second loop can't be started in this one.
+
+    Args:
+        coroutine (Coroutine[Any, Any, T]): the coroutine to run
+
+    Returns:
+        T: the coroutine's result
+    """
+    try:
+        _ = asyncio.get_running_loop()
+    except RuntimeError:
+        loop_factory = uvloop.new_event_loop if uvloop is not None else None
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            return runner.run(coroutine)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(run_coroutine, coroutine).result()
+
+
+class IsalDecompressor:
+    """
+    A wrapper around ISA-L's decompression object which re-raises its errors as zlib.error 
+    (isal_zlib.error isn't a subclass of it), so that it can stand in for zlib's.
+    """
+    def __init__(self, wbits: int = zlib.MAX_WBITS):
+        self.decompressor = isal_zlib.decompressobj(wbits)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.decompressor, name)  # eof, unused_data, unconsumed_tail
+
+    def decompress(self, data: bytes, max_length: int = 0) -> bytes:
+        try:
+            return self.decompressor.decompress(data, max_length)
+        except isal_zlib.error as error:
+            raise zlib.error(str(error)) from error
+
+    def flush(self, *args: int) -> bytes:
+        try:
+            return self.decompressor.flush(*args)
+        except isal_zlib.error as error:
+            raise zlib.error(str(error)) from error
+
+
+def use_isal_for_zip_decompression() -> bool:
+    """
+    Opt in to having zipfile decompress with ISA-L's SIMD-accelerated DEFLATE, if python-isal 
+    is installed. 
+    
+    This changes how every ZipFile in the process is read, so it is left to the scripts that 
+    want it to call this, rather than happening when this module is imported. Only decompression 
+    is affected: zipfile keeps using the stdlib's compressobj (ISA-L only accepts compression 
+    levels 0-3) and crc32, and ISA-L's errors are raised as zlib.error, as they would be otherwise.
+
+    Returns:
+        bool: whether ISA-L is now being used for decompression
+    """
+    if isal_zlib is None:
+        return False
+
+    zlib_with_isal_decompression = types.ModuleType("zlib")
+    zlib_with_isal_decompression.__dict__.update(vars(zlib))
+    zlib_with_isal_decompression.decompressobj = IsalDecompressor
+    zipfile_module.zlib = zlib_with_isal_decompression
+    return True
+
+
+def get_resumption_headers(zipfile_path: Path, remote_size: int, validator: str | None) -> dict[str, str]:
+    """
+    Choose the headers for a request for a zipfile of which there is already a local copy.
+    
+    If the local copy is smaller than the remote file, the download was interrupted, and we 
+    ask for only the remaining bytes. The request carries an If-Range header so that, if the 
+    remote file has changed since, the server sends all of it rather than bytes that don't 
+    belong after the local ones. If the local copy is complete, we ask for the file only if 
+    it has been modified since it was saved, so that the server can reply with a 304 and no body.
+
+    Args:
+        zipfile_path (Path): the path to the local copy of the zipfile
+        remote_size (int): the size of the remote file, as reported by its Content-Length header
+        validator (str | None): the remote file's strong ETag, or failing that, its Last-Modified date
+
+    Returns:
+        dict[str, str]: the headers to send with the request
+    """
+    local_size = zipfile_path.stat().st_size
+
+    if 0 < local_size < remote_size and validator is not None:
+        return {"Range": f"bytes={local_size}-", "If-Range": validator}
+    elif 0 < local_size == remote_size:
+        return {"If-Modified-Since": formatdate(zipfile_path.stat().st_mtime, usegmt=True)}
+    else:
+        return {}
+
+
+async def _fetch(session: aiohttp.ClientSession, url: str, zipfile_path: Path) -> bool:
+    """
+    Stream the zipfile at the given URL to disk in 64KB chunks, so that the whole zipfile is never 
+    held in memory. 
+    
+    The download is written to a "<name>.zip.partial" file, which only takes the zipfile's name once 
+    the download is complete. This way, an interrupted download can be resumed on the next run, and 
+    a zipfile that has been kept from a previous run is only downloaded again if it has changed.
+
+    Args:
+        session (aiohttp.ClientSession): the session through which to make the requests
+        url (str): the link to the zipfile
+        zipfile_path (Path): where the zipfile is to be saved
+
+    Returns:
+        bool: whether the zipfile is now saved at zipfile_path
+    """
+    zipfile_name = DataDownloader.get_zipfile_name(url=url)
+    partial_path = zipfile_path.with_name(f"{zipfile_path.name}.partial")
+
+    try:
+        headers = {}
+        if zipfile_path.exists():
+            headers = {"If-Modified-Since": formatdate(zipfile_path.stat().st_mtime, usegmt=True)}
+        elif partial_path.exists():
+            async with session.head(url, allow_redirects=True) as head:
+                # Without a successful response, there is no size or validator against which to compare the partial file
+                if head.status == 200:
+                    etag = head.headers.get("ETag")
+                    validator = etag if etag is not None and not etag.startswith("W/") else head.headers.get("Last-Modified")
+
+                    headers = get_resumption_headers(
+                        zipfile_path=partial_path, remote_size=head.content_length or 0, validator=validator
+                    )
+
+        logger.info(f"Downloading {zipfile_name}")
+        async with session.get(url, headers=headers) as response:
+            response.raise_for_status()
+
+            if response.status == 304:
+                if not zipfile_path.exists():
+                    _ = partial_path.replace(zipfile_path)  # The partial file was complete, but had not been renamed
+
+                logger.success(f"The saved copy of {zipfile_name} is up to date")
+                return True
+
+            mode = "ab" if response.status == 206 else "wb"  # 206 means the download is being resumed
+            async with aiofiles.open(partial_path, mode=mode) as file:
+                async for chunk in response.content.iter_chunked(1 << 16):
+                    _ = await file.write(chunk)
+
+        _ = partial_path.replace(zipfile_path)
+        logger.success(f"Downloaded {zipfile_name}")
+        return True
+
+    except Exception as error:
+        logger.error(error)
+        return False
+
+
 if __name__ == "__main__":
 
     parser = ArgumentParser()
     _ = parser.add_argument("--cities", nargs="+", type=str)
     _ = parser.add_argument("--year", type=int)
+    _ = parser.add_argument("--keep_zipfiles", action="store_true")
     args = parser.parse_args()
-    
+
+    _ = use_isal_for_zip_decompression()
     for city in args.cities:
         processor = DataDownloader(city_name=city, year=args.year)
-        _= processor.load_raw_data(just_download=True)        
+        _= processor.load_raw_data(just_download=True, keep_zipfiles=args.keep_zipfiles)        
 
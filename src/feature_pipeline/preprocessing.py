@@ -9,7 +9,7 @@ import pandas as pd
 
 from argparse import ArgumentParser
 from src.setup.config import config
-from src.feature_pipeline.data_sourcing import DataDownloader 
+from src.feature_pipeline.data_sourcing import DataDownloader, use_isal_for_zip_decompression
 #from src.feature_pipeline.mixed_indexer import run_mixed_indexer
 #from src.feature_pipeline.rounding_indexer import run_rounding_indexer
 #from src.feature_pipeline.feature_engineering import finish_feature_engineering
@@ -663,6 +663,8 @@ if __name__ == "__main__":
     _ = parser.add_argument("--year", type=int)
 
     args = parser.parse_args()
+
+    _ = use_isal_for_zip_decompression()
     for city_name in args.cities:
         trips_2024 = DataProcessor(year=args.year, city_name=city_name, for_inference=False)
         try:
@@ -1,14 +1,15 @@
-import os 
 from pathlib import Path 
+from functools import cache
 
 from tqdm import tqdm 
 
 
-PARENT_DIR = Path("_file_").parent.resolve()
+PARENT_DIR = Path(__file__).resolve().parents[2]  # The root of the repository
 IMAGES_DIR = PARENT_DIR/"images"
 
 DATA_DIR = PARENT_DIR/"data"
 RAW_DATA_DIR = DATA_DIR/"raw"
+PARQUETS = RAW_DATA_DIR/"parquets"
 
 MODELS_DIR = PARENT_DIR/"models"
 LOCAL_SAVE_DIR = MODELS_DIR/"locally_created"
@@ -24,32 +25,30 @@ INFERENCE_DATA = TRANSFORMED_DATA/"inference"
 
 
 
+@cache
 def make_needed_directories() -> None:
-    
+    """
+    Create the data and model directories. This is idempotent, so the work is only 
+    done on the first call, with later calls returning immediately.
+    """
     from src.setup.config import cities  # Forgive the odd placement. I'm avoiding circular import errors
 
     major_paths = [
-        DATA_DIR, CLEANED_DATA, RAW_DATA_DIR, GEOGRAPHICAL_DATA, TRANSFORMED_DATA, TIME_SERIES_DATA, 
+        DATA_DIR, CLEANED_DATA, RAW_DATA_DIR, PARQUETS, GEOGRAPHICAL_DATA, TRANSFORMED_DATA, TIME_SERIES_DATA, 
         IMAGES_DIR, TRAINING_DATA, INFERENCE_DATA, MODELS_DIR, LOCAL_SAVE_DIR, COMET_SAVE_DIR 
         
     ]
 
     for path in tqdm(iterable=major_paths, desc="Creating data directories..."):
-
-        if not Path(path).exists():
-            os.mkdir(path)
+        path.mkdir(parents=True, exist_ok=True)
         
         # The directories that holds geographical data will have a different structure.
         for city in cities:  
             # These directories don't need subdirectories for each city
             if path not in [PARENT_DIR, DATA_DIR, TRANSFORMED_DATA, MODELS_DIR]:
-                if not Path(path/city).exists():
-                    os.mkdir(path/city)
+                (path/city).mkdir(exist_ok=True)
 
         if path == GEOGRAPHICAL_DATA:
             for city in cities:
                 for indexer_name in ["mixed_indexer", "rounding_indexer"]:
-                    indexer_path_for_city = path/city/indexer_name
-                    if not Path(indexer_path_for_city).exists():
-                        os.mkdir(indexer_path_for_city)
-
+                    (path/city/indexer_name).mkdir(exist_ok=True)
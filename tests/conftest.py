@@ -0,0 +1,9 @@
+import os
+
+
+# src.setup.config validates these settings when it is imported, so give them placeholder values 
+# if they aren't already set (e.g. in a .env file).
+for setting in [
+    "EMAIL", "COMET_API_KEY", "COMET_WORKSPACE", "HOPSWORKS_API_KEY", "HOPSWORKS_PROJECT_NAME", "DATABASE_PUBLIC_URL"
+]:
+    _ = os.environ.setdefault(setting, "placeholder")
@@ -0,0 +1,177 @@
+import io
+import os
+import zlib
+import asyncio
+import zipfile
+import pytest
+import pandas as pd
+from pathlib import Path
+from email.utils import formatdate
+
+from src.feature_pipeline.data_sourcing import (
+    DataDownloader, get_resumption_headers, read_trip_table, run_coroutine, use_isal_for_zip_decompression
+)
+
+
+TRIP_DATA_HEADER = (
+    "ride_id,rideable_type,started_at,ended_at,start_station_name,start_station_id,end_station_name,"
+    "end_station_id,start_lat,start_lng,end_lat,end_lng,member_casual\n"
+)
+
+
+def write_trip_data(directory: Path, rows: list[str]) -> Path:
+    csv_path = directory/"202401-divvy-tripdata.csv"
+    _ = csv_path.write_text(TRIP_DATA_HEADER + "\n".join(rows) + "\n")
+    return csv_path
+
+
+def test_blank_station_id_is_loaded_as_missing(tmp_path: Path):
+    csv_path = write_trip_data(
+        directory=tmp_path,
+        rows=[
+            "A1,electric_bike,2024-01-12 15:30:27,2024-01-12 15:40:00,Clark St,TA1307000039,Clark St,TA1307000039,41.9,-87.6,41.91,-87.62,member",
+            "A2,electric_bike,2024-01-12 16:30:27,2024-01-12 16:40:00,,,Clark St,TA1307000039,41.9,-87.6,41.91,-87.62,casual"
+        ]
+    )
+
+    data = read_trip_table(csv_path=csv_path).to_pandas()
+
+    assert data["start_station_id"].isna().tolist() == [False, True]
+    assert pd.isna(data.loc[1, "start_station_id"])
+
+
+def test_blank_string_cells_are_loaded_as_missing_in_every_string_column(tmp_path: Path):
+    csv_path = write_trip_data(
+        directory=tmp_path,
+        rows=[
+            "A1,electric_bike,2024-01-12 15:30:27,2024-01-12 15:40:00,Clark St,TA1307000039,Clark St,TA1307000039,41.9,-87.6,41.91,-87.62,member",
+            ",,2024-01-12 16:30:27,2024-01-12 16:40:00,,,,,41.9,-87.6,41.91,-87.62,"
+        ]
+    )
+
+    data = read_trip_table(csv_path=csv_path).to_pandas()
+    string_columns = [
+        "ride_id", "rideable_type", "start_station_name", "start_station_id", "end_station_name", "end_station_id", "member_casual"
+    ]
+
+    assert data.loc[0, string_columns].notna().all()
+    assert data.loc[1, string_columns].isna().all()
+
+
+def test_trip_data_is_loaded_with_the_known_column_types(tmp_path: Path):
+    csv_path = write_trip_data(
+        directory=tmp_path,
+        rows=[
+            "A1,electric_bike,2024-01-12 15:30:27.123,2024-01-12 15:40:00,Clark St,TA1307000039,Clark St,TA1307000039,41.9,-87.6,41.91,-87.62,member",
+            "A2,classic_bike,2024-01-12 16:30:27,2024-01-12 16:40:00,Clark St,KA1504000135,Clark St,13022,41.9,-87.6,41.91,-87.62,casual"
+        ]
+    )
+
+    data = read_trip_table(csv_path=csv_path).to_pandas()
+
+    assert isinstance(data["rideable_type"].dtype, pd.CategoricalDtype)
+    assert isinstance(data["member_casual"].dtype, pd.CategoricalDtype)
+    assert pd.api.types.is_datetime64_any_dtype(data["started_at"])
+    assert data.loc[0, "started_at"] == pd.Timestamp("2024-01-12 15:30:27.123")
+    assert data["start_lat"].dtype == "float64"
+    assert data["end_station_id"].tolist() == ["TA1307000039", "13022"]
+
+
+def test_zipfile_name_is_taken_from_the_end_of_the_url():
+    url = "https://divvy-tripdata.s3.amazonaws.com/202401-divvy-tripdata.zip"
+    assert DataDownloader.get_zipfile_name(url=url) == "202401-divvy-tripdata.zip"
+
+
+def test_url_ending_in_a_slash_is_rejected():
+    with pytest.raises(Exception, match="Invalid URL"):
+        _ = DataDownloader.get_zipfile_name(url="https://s3.amazonaws.com/tripdata/")
+
+
+def test_coroutine_is_run_without_changing_the_event_loop_policy():
+
+    async def add(a: int, b: int) -> int:
+        return a + b
+
+    policy = asyncio.get_event_loop_policy()
+    assert run_coroutine(add(1, 2)) == 3
+    assert asyncio.get_event_loop_policy() is policy
+
+
+def test_coroutine_can_be_run_from_inside_a_running_event_loop():
+
+    async def add(a: int, b: int) -> int:
+        return a + b
+
+    async def caller() -> int:
+        return run_coroutine(add(1, 2))
+
+    assert asyncio.run(caller()) == 3
+
+
+def make_zipfile(contents: bytes) -> io.BytesIO:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, mode="w", compression=zipfile.ZIP_DEFLATED, compresslevel=9) as archive:
+        archive.writestr("202401-divvy-tripdata.csv", contents)
+
+    _ = buffer.seek(0)
+    return buffer
+
+
+def test_importing_data_sourcing_leaves_zipfile_untouched():
+    assert zipfile.zlib is zlib
+
+
+def test_isal_decompression_reads_zipfiles_and_raises_zlib_errors(monkeypatch: pytest.MonkeyPatch):
+    _ = pytest.importorskip("isal")
+    monkeypatch.setattr(zipfile, "zlib", zipfile.zlib)  # Undo the opt-in once the test is over
+    assert use_isal_for_zip_decompression()
+
+    contents = TRIP_DATA_HEADER.encode() * 1000
+    with zipfile.ZipFile(make_zipfile(contents=contents)) as archive:
+        assert archive.read("202401-divvy-tripdata.csv") == contents
+
+    # Writing with compression levels that ISA-L doesn't support still works
+    _ = make_zipfile(contents=contents)
+
+    corrupted = bytearray(make_zipfile(contents=contents).getvalue())
+    data_start = 30 + len("202401-divvy-tripdata.csv")  # Skip the local file header
+    corrupted[data_start:data_start + 20] = b"\xff" * 20
+
+    with zipfile.ZipFile(io.BytesIO(bytes(corrupted))) as archive, pytest.raises(zlib.error):
+        _ = archive.read("202401-divvy-tripdata.csv")
+
+
+def write_partial_zipfile(directory: Path, size: int) -> Path:
+    partial_path = directory/"202401-divvy-tripdata.zip.partial"
+    _ = partial_path.write_bytes(b"x" * size)
+    return partial_path
+
+
+def test_shorter_local_copy_asks_for_the_remaining_bytes_if_unchanged(tmp_path: Path):
+    partial_path = write_partial_zipfile(directory=tmp_path, size=100)
+
+    headers = get_resumption_headers(zipfile_path=partial_path, remote_size=250, validator='"abc123"')
+
+    assert headers == {"Range": "bytes=100-", "If-Range": '"abc123"'}
+
+
+def test_shorter_local_copy_is_downloaded_again_without_a_validator(tmp_path: Path):
+    partial_path = write_partial_zipfile(directory=tmp_path, size=100)
+
+    assert get_resumption_headers(zipfile_path=partial_path, remote_size=250, validator=None) == {}
+
+
+def test_complete_local_copy_is_only_downloaded_again_if_modified(tmp_path: Path):
+    partial_path = write_partial_zipfile(directory=tmp_path, size=250)
+    os.utime(partial_path, (1_700_000_000, 1_700_000_000))
+
+    headers = get_resumption_headers(zipfile_path=partial_path, remote_size=250, validator='"abc123"')
+
+    assert headers == {"If-Modified-Since": formatdate(1_700_000_000, usegmt=True)}
+    assert headers["If-Modified-Since"] == "Tue, 14 Nov 2023 22:13:20 GMT"
+
+
+def test_larger_local_copy_is_downloaded_again(tmp_path: Path):
+    partial_path = write_partial_zipfile(directory=tmp_path, size=300)
+
+    assert get_resumption_headers(zipfile_path=partial_path, remote_size=250, validator='"abc123"') == {}